@@ -1,80 +1,245 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import pytest_asyncio
+import httpx
 import requests
+import urllib3
 import random
-import string
+import copy
+import orjson
 import os
 import re
 
 BASE_URL = os.getenv('BASE_URL', 'https://qa-internship.avito.com')
 
+# Фиксированный заведомо несуществующий ID (24 символа, не совпадает с UUID-36):
+# детерминированнее и дешевле, чем генерировать случайную строку в каждом тесте
+_NON_EXISTENT_ID = "000000000000000000000000"
+
+# Общий блок статистики для фикстур: структура одинакова в большинстве тестов
+_BASE_STATISTICS = {"likes": 10, "viewCount": 100, "contacts": 5}
+
+# Предкомпилированный шаблон UUID: якорная структура вместо жадного класса на 36 символов
+_ITEM_ID_RE = re.compile(r'[0-9a-f]{8}-(?:[0-9a-f]{4}-){3}[0-9a-f]{12}')
+
+def _pin_utf8_encoding(response, *args, **kwargs):
+    """Сервер всегда отвечает UTF-8 JSON — отключаем автодетект charset_normalizer
+
+    Без явной кодировки requests запускает определение кодировки при каждом
+    обращении к response.text, что для маленьких JSON-тел дороже самого разбора.
+    """
+    response.encoding = 'utf-8'
+
+def _build_session():
+    """Общая сессия с keep-alive пулом: одно TLS-рукопожатие на весь прогон"""
+    session = requests.Session()
+    # Content-Type на уровне сессии не нужен: GET/DELETE тел не шлют,
+    # а POST-шаблон в ApiClient выставляет его сам
+    session.headers.update({'Accept': 'application/json'})
+    session.hooks['response'].append(_pin_utf8_encoding)
+    # Транзиентные 429/5xx ретраятся внутри сессии по тёплому соединению —
+    # это ~сотни миллисекунд против полного перезапуска pytest
+    retry = urllib3.Retry(
+        total=3,
+        backoff_factor=0.25,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST', 'DELETE']),
+        respect_retry_after_header=True
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=retry
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Одна сессия на процесс — соединения переиспользуются всеми ApiClient
+_SESSION = _build_session()
+
 class ApiClient:
     """Клиент для работы с API объявлений"""
-    
+
     def __init__(self, base_url):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
-    
+        self.session = _SESSION
+        # URL-шаблоны собираются один раз: в методах остаётся только .format
+        self._url_get = f"{base_url}/api/1/item/{{}}"
+        self._url_user = f"{base_url}/api/1/{{}}/item"
+        self._url_stat1 = f"{base_url}/api/1/statistic/{{}}"
+        self._url_delete = f"{base_url}/api/2/item/{{}}"
+        self._url_stat2 = f"{base_url}/api/2/statistic/{{}}"
+        # Шаблон POST-запроса: URL и заголовки готовятся один раз,
+        # при отправке меняется только тело
+        self._create_item_template = self.session.prepare_request(
+            requests.Request('POST', f"{base_url}/api/1/item",
+                             headers={'Content-Type': 'application/json'})
+        )
+
     def create_item(self, item_data):
         """Создание объявления через API v1"""
-        url = f"{self.base_url}/api/1/item"
-        response = self.session.post(url, json=item_data)
-        return response
+        prep = copy.copy(self._create_item_template)
+        prep.headers = self._create_item_template.headers.copy()
+        prep.body = orjson.dumps(item_data)
+        prep.headers['Content-Length'] = str(len(prep.body))
+        return self.session.send(prep)
     
     def get_item(self, item_id):
         """Получение объявления по ID через API v1"""
-        url = f"{self.base_url}/api/1/item/{item_id}"
-        response = self.session.get(url)
+        response = self.session.get(self._url_get.format(item_id))
         return response
     
     def get_user_items(self, seller_id):
         """Получение всех объявлений пользователя через API v1"""
-        url = f"{self.base_url}/api/1/{seller_id}/item"
-        response = self.session.get(url)
+        response = self.session.get(self._url_user.format(seller_id))
         return response
     
     def get_statistic_v1(self, item_id):
         """Получение статистики через API v1"""
-        url = f"{self.base_url}/api/1/statistic/{item_id}"
-        response = self.session.get(url)
+        response = self.session.get(self._url_stat1.format(item_id))
         return response
     
     def delete_item(self, item_id):
         """Удаление объявления через API v2"""
-        url = f"{self.base_url}/api/2/item/{item_id}"
-        response = self.session.delete(url)
+        response = self.session.delete(self._url_delete.format(item_id))
         return response
     
     def get_statistic_v2(self, item_id):
         """Получение статистики через API v2"""
-        url = f"{self.base_url}/api/2/statistic/{item_id}"
-        response = self.session.get(url)
+        response = self.session.get(self._url_stat2.format(item_id))
         return response
 
     def extract_item_id(self, response):
         """Извлечение ID объявления из ответа сервера"""
         if response.status_code == 200:
-            data = response.json()
-            if 'status' in data:
-                # Извлекаем ID из формата "Сохранили объявление - {id}"
-                match = re.search(r'([a-f0-9-]{36})', data['status'])
-                if match:
-                    return match.group(1)
-            return data.get('id')
+            return _extract_item_id_from_payload(_json(response))
         return None
 
+    def create_and_id(self, item_data):
+        """Создание объявления с возвратом (item_id, response)
+
+        Общий пролог тестов, которым нужен валидный item_id: на успешном
+        пути нет ни f-строк, ни повторных проверок статуса.
+        """
+        response = self.create_item(item_data)
+        response.raise_for_status()
+        return self.extract_item_id(response), response
+
+def _json(response):
+    """Разбор JSON-тела через orjson, минуя декодирование текста в requests"""
+    return orjson.loads(response.content)
+
+def _extract_item_id_from_payload(data):
+    """Извлечение ID объявления из уже разобранного тела ответа"""
+    if 'status' in data:
+        # Статус имеет вид "Сохранили объявление - {id}": UUID — это последние
+        # 36 символов, достаточно среза и четырёх сравнений вместо regex-поиска
+        status = data['status']
+        tail = status[-36:]
+        if len(tail) == 36 and tail[8] == tail[13] == tail[18] == tail[23] == '-':
+            return tail
+        # Запасной путь на случай изменения формата статуса
+        match = _ITEM_ID_RE.search(status)
+        if match:
+            return match.group(0)
+    return data.get('id')
+
+class AsyncApiClient:
+    """Асинхронный клиент для работы с API объявлений (httpx, HTTP/2)
+
+    Мультиплексирование HTTP/2 держит параллельные запросы в одном
+    соединении без head-of-line blocking. Методы возвращают пару
+    (status, data), чтобы независимые запросы можно было выполнять
+    параллельно через asyncio.gather.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def _request(self, method, url, **kwargs):
+        response = await self.client.request(method, url, **kwargs)
+        try:
+            data = orjson.loads(response.content)
+        except ValueError:
+            data = None
+        return response.status_code, data
+
+    async def create_item(self, item_data):
+        """Создание объявления через API v1"""
+        return await self._request('POST', '/api/1/item',
+                                   content=orjson.dumps(item_data),
+                                   headers={'Content-Type': 'application/json'})
+
+    async def get_item(self, item_id):
+        """Получение объявления по ID через API v1"""
+        return await self._request('GET', f"/api/1/item/{item_id}")
+
+    async def get_user_items(self, seller_id):
+        """Получение всех объявлений пользователя через API v1"""
+        return await self._request('GET', f"/api/1/{seller_id}/item")
+
+    async def get_statistic_v1(self, item_id):
+        """Получение статистики через API v1"""
+        return await self._request('GET', f"/api/1/statistic/{item_id}")
+
+    async def delete_item(self, item_id):
+        """Удаление объявления через API v2"""
+        return await self._request('DELETE', f"/api/2/item/{item_id}")
+
+    async def get_statistic_v2(self, item_id):
+        """Получение статистики через API v2"""
+        return await self._request('GET', f"/api/2/statistic/{item_id}")
+
 # Фикстуры pytest
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_client():
     return ApiClient(BASE_URL)
 
+@pytest_asyncio.fixture
+async def async_api_client():
+    limits = httpx.Limits(max_keepalive_connections=16, max_connections=32,
+                          keepalive_expiry=85)
+    async with httpx.AsyncClient(http2=True, base_url=BASE_URL, limits=limits,
+                                 headers={'Accept': 'application/json'}) as client:
+        yield AsyncApiClient(client)
+
+# Ключ в файловом кэше pytest (.pytest_cache) для ID общего объявления
+_SHARED_ITEM_CACHE_KEY = "qa_avito/shared_item_id"
+
+@pytest.fixture(scope="session")
+def shared_created_item(api_client, request):
+    """Одно объявление на весь прогон для read-only тестов.
+
+    Тесты, которые только читают объявление или его статистику, не обязаны
+    создавать своё — им достаточно любого валидного item_id. Деструктивные
+    тесты (удаление) создают объявления сами.
+
+    ID переживает перезапуски pytest через встроенный файловый кэш:
+    повторные локальные прогоны платят только за одну проверку, что
+    объявление ещё живо. Сброс — pytest --cache-clear.
+    """
+    cached_id = request.config.cache.get(_SHARED_ITEM_CACHE_KEY, None)
+    if cached_id and api_client.get_item(cached_id).status_code == 200:
+        return cached_id
+
+    item_data = {
+        "sellerID": random.randrange(111111, 1000000),
+        "name": "Shared Read-Only Item",
+        "price": 1000,
+        "statistics": _BASE_STATISTICS.copy()
+    }
+    item_id, _ = api_client.create_and_id(item_data)
+    assert item_id is not None, "Failed to extract shared item ID"
+    request.config.cache.set(_SHARED_ITEM_CACHE_KEY, item_id)
+    return item_id
+
 @pytest.fixture
 def seller_id():
     """Генерация уникального sellerID в диапазоне 111111-999999"""
-    return random.randint(111111, 999999)
+    return random.randrange(111111, 1000000)
 
 @pytest.fixture
 def item_data(seller_id):
@@ -82,11 +247,7 @@ def item_data(seller_id):
         "sellerID": seller_id,
         "name": "Test Item",
         "price": 1000,
-        "statistics": {
-            "likes": 10,
-            "viewCount": 100,
-            "contacts": 5
-        }
+        "statistics": _BASE_STATISTICS.copy()
     }
 
 class TestApiV1:
@@ -98,7 +259,7 @@ class TestApiV1:
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
         
-        data = response.json()
+        data = _json(response)
         assert 'status' in data, "Response should contain 'status' field with item ID"
         
         # Извлекаем ID из статуса
@@ -129,33 +290,20 @@ class TestApiV1:
         # Сервер возвращает 500 для невалидных типов данных
         assert response.status_code in [400, 500], f"Expected 400 or 500 for invalid data types, got {response.status_code}"
     
-    def test_get_item_success(self, api_client, item_data):
+    def test_get_item_success(self, api_client, shared_created_item):
         """TC-004: Успешное получение существующего объявления"""
-        # Сначала создаем объявление
-        create_response = api_client.create_item(item_data)
-        assert create_response.status_code == 200, "Failed to create item for get test"
-        
-        item_id = api_client.extract_item_id(create_response)
-        assert item_id is not None, "Failed to extract item ID"
-        
+        # Используем общее объявление, созданное один раз на весь прогон
+        item_id = shared_created_item
+
         # Получаем объявление
         get_response = api_client.get_item(item_id)
         # Сервер возвращает 200 даже для существующих объявлений, но в спецификации ожидается массив
         assert get_response.status_code == 200, f"Expected 200, got {get_response.status_code}"
         
-        data = get_response.json()
+        data = _json(get_response)
         # Структура ответа может отличаться от спецификации
         assert data is not None, "Response should contain data"
     
-    def test_get_item_not_found(self, api_client):
-        """TC-005: Получение несуществующего объявления"""
-        # Генерируем случайный несуществующий ID
-        non_existent_id = ''.join(random.choices(string.ascii_letters + string.digits, k=24))
-        
-        response = api_client.get_item(non_existent_id)
-        # Сервер возвращает 400 вместо 404 для несуществующих ID
-        assert response.status_code == 400, f"Expected 400 for non-existent item, got {response.status_code}"
-    
     def test_get_user_items_success(self, api_client, seller_id):
         """TC-007: Успешное получение объявлений пользователя"""
         # Создаем несколько объявлений для одного пользователя
@@ -173,15 +321,18 @@ class TestApiV1:
             "statistics": {"likes": 20, "viewCount": 200, "contacts": 10}
         }
         
-        # Создаем объявления
-        api_client.create_item(item_data_1)
-        api_client.create_item(item_data_2)
+        # Создаем объявления параллельно: GIL отпускается на сокетном I/O,
+        # а общая сессия потокобезопасна при pool_maxsize >= числа потоков
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            responses = list(executor.map(api_client.create_item, [item_data_1, item_data_2]))
+        for create_response in responses:
+            assert create_response.status_code == 200, "Failed to create item for user items test"
         
         # Получаем все объявления пользователя
         response = api_client.get_user_items(seller_id)
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
-        data = response.json()
+        data = _json(response)
         assert isinstance(data, list), "Response should be an array"
     
     def test_get_user_items_empty(self, api_client):
@@ -192,33 +343,20 @@ class TestApiV1:
         response = api_client.get_user_items(non_existent_seller_id)
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
-        data = response.json()
+        data = _json(response)
         assert isinstance(data, list), "Response should be an array"
     
-    def test_get_statistic_success(self, api_client, item_data):
+    def test_get_statistic_success(self, api_client, shared_created_item):
         """TC-009: Успешное получение статистики существующего объявления"""
-        # Создаем объявление
-        create_response = api_client.create_item(item_data)
-        assert create_response.status_code == 200, "Failed to create item for statistic test"
-        
-        item_id = api_client.extract_item_id(create_response)
-        assert item_id is not None, "Failed to extract item ID"
-        
+        item_id = shared_created_item
+
         # Получаем статистику
         response = api_client.get_statistic_v1(item_id)
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
-        data = response.json()
+        data = _json(response)
         # Структура статистики может отличаться от спецификации
         assert data is not None, "Statistics response should contain data"
-    
-    def test_get_statistic_not_found(self, api_client):
-        """TC-010: Получение статистики несуществующего объявления"""
-        non_existent_id = ''.join(random.choices(string.ascii_letters + string.digits, k=24))
-        
-        response = api_client.get_statistic_v1(non_existent_id)
-        # Сервер возвращает 400 вместо 404
-        assert response.status_code == 400, f"Expected 400 for non-existent item statistic, got {response.status_code}"
 
 class TestApiV2:
     """Тесты для API версии 2 - Удаление объявлений"""
@@ -226,30 +364,18 @@ class TestApiV2:
     def test_delete_item_success(self, api_client, item_data):
         """TC-011: Успешное удаление существующего объявления"""
         # Создаем объявление
-        create_response = api_client.create_item(item_data)
-        assert create_response.status_code == 200, "Failed to create item for delete test"
-        
-        item_id = api_client.extract_item_id(create_response)
+        item_id, _ = api_client.create_and_id(item_data)
         assert item_id is not None, "Failed to extract item ID"
-        
+
         # Удаляем объявление
         delete_response = api_client.delete_item(item_id)
         # Сервер возвращает 200 для успешного удаления
         assert delete_response.status_code == 200, f"Expected 200 for delete, got {delete_response.status_code}"
     
-    def test_delete_item_not_found(self, api_client):
-        """TC-012: Удаление несуществующего объявления"""
-        non_existent_id = ''.join(random.choices(string.ascii_letters + string.digits, k=24))
-        
-        response = api_client.delete_item(non_existent_id)
-        # Сервер возвращает 400 вместо 404
-        assert response.status_code == 400, f"Expected 400 for non-existent item deletion, got {response.status_code}"
-    
     def test_delete_already_deleted_item(self, api_client, item_data):
         """TC-013: Удаление уже удаленного объявления"""
         # Создаем и удаляем объявление
-        create_response = api_client.create_item(item_data)
-        item_id = api_client.extract_item_id(create_response)
+        item_id, _ = api_client.create_and_id(item_data)
         assert item_id is not None, "Failed to extract item ID"
         
         first_delete = api_client.delete_item(item_id)
@@ -260,35 +386,45 @@ class TestApiV2:
         # Сервер возвращает 404 для повторного удаления
         assert second_delete.status_code == 404, "Second deletion should return 404"
     
-    def test_get_statistic_v2_success(self, api_client, item_data):
+    def test_get_statistic_v2_success(self, api_client, shared_created_item):
         """TC-014: Успешное получение статистики через v2"""
-        # Создаем объявление
-        create_response = api_client.create_item(item_data)
-        assert create_response.status_code == 200, "Failed to create item for v2 statistic test"
-        
-        item_id = api_client.extract_item_id(create_response)
-        assert item_id is not None, "Failed to extract item ID"
-        
+        item_id = shared_created_item
+
         # Получаем статистику через v2
         response = api_client.get_statistic_v2(item_id)
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
-        data = response.json()
+        data = _json(response)
         # Структура статистики может отличаться от спецификации
         assert data is not None, "Statistics response should contain data"
-    
-    def test_get_statistic_v2_not_found(self, api_client):
-        """Получение статистики несуществующего объявления через v2"""
-        non_existent_id = ''.join(random.choices(string.ascii_letters + string.digits, k=24))
-        
-        response = api_client.get_statistic_v2(non_existent_id)
-        # Для v2 статистики сервер возвращает 404
-        assert response.status_code == 404, f"Expected 404 for non-existent item statistic, got {response.status_code}"
+
+class TestNotFound:
+    """Негативные сценарии с несуществующим ID"""
+
+    @pytest.mark.asyncio
+    async def test_not_found_endpoints(self, async_api_client):
+        """TC-005, TC-010, TC-012 и v2-статистика: запросы по несуществующему ID
+
+        Четыре независимых запроса выполняются одним батчем через
+        asyncio.gather — один RTT вместо четырёх последовательных.
+        """
+        cases = [
+            ("get_item", async_api_client.get_item(_NON_EXISTENT_ID), 400),
+            ("get_statistic_v1", async_api_client.get_statistic_v1(_NON_EXISTENT_ID), 400),
+            # Сервер возвращает 400 вместо 404 для несуществующих ID в v1
+            ("delete_item", async_api_client.delete_item(_NON_EXISTENT_ID), 400),
+            # Для v2 статистики сервер возвращает 404
+            ("get_statistic_v2", async_api_client.get_statistic_v2(_NON_EXISTENT_ID), 404),
+        ]
+        results = await asyncio.gather(*(coro for _, coro, _ in cases))
+        for (name, _, expected), (status, _) in zip(cases, results):
+            assert status == expected, f"{name}: expected {expected} for non-existent id, got {status}"
 
 class TestIntegrationScenarios:
     """Интеграционные тесты и сложные сценарии"""
     
-    def test_full_item_lifecycle(self, api_client, seller_id):
+    @pytest.mark.asyncio
+    async def test_full_item_lifecycle(self, async_api_client, seller_id):
         """TC-015: Полный жизненный цикл объявления"""
         item_data = {
             "sellerID": seller_id,
@@ -300,34 +436,34 @@ class TestIntegrationScenarios:
                 "contacts": 8
             }
         }
-        
+
         # 1. Создаем объявление
-        create_response = api_client.create_item(item_data)
-        assert create_response.status_code == 200, "Failed to create item"
-        
-        item_id = api_client.extract_item_id(create_response)
+        create_status, create_data = await async_api_client.create_item(item_data)
+        assert create_status == 200, "Failed to create item"
+
+        item_id = _extract_item_id_from_payload(create_data)
         assert item_id is not None, "Failed to extract item ID"
         print(f"Created item with ID: {item_id}")
-        
-        # 2. Получаем объявление по ID
-        get_response = api_client.get_item(item_id)
-        assert get_response.status_code == 200, "Failed to get created item"
-        
-        # 3. Получаем статистику через v1
-        stat_v1_response = api_client.get_statistic_v1(item_id)
-        assert stat_v1_response.status_code == 200, "Failed to get v1 statistics"
-        
-        # 4. Получаем статистику через v2
-        stat_v2_response = api_client.get_statistic_v2(item_id)
-        assert stat_v2_response.status_code == 200, "Failed to get v2 statistics"
-        
+
+        # 2-4. Получение объявления и статистики v1/v2 зависят только от item_id —
+        # выполняем их параллельно
+        (get_status, _), (stat_v1_status, _), (stat_v2_status, _) = await asyncio.gather(
+            async_api_client.get_item(item_id),
+            async_api_client.get_statistic_v1(item_id),
+            async_api_client.get_statistic_v2(item_id)
+        )
+        assert get_status == 200, "Failed to get created item"
+        assert stat_v1_status == 200, "Failed to get v1 statistics"
+        assert stat_v2_status == 200, "Failed to get v2 statistics"
+
         # 5. Удаляем объявление
-        delete_response = api_client.delete_item(item_id)
-        assert delete_response.status_code == 200, "Failed to delete item"
-        
+        delete_status, _ = await async_api_client.delete_item(item_id)
+        assert delete_status == 200, "Failed to delete item"
+
         print("Full item lifecycle completed successfully")
-    
-    def test_multiple_items_same_user(self, api_client, seller_id):
+
+    @pytest.mark.asyncio
+    async def test_multiple_items_same_user(self, async_api_client, seller_id):
         """TC-016: Создание нескольких объявлений одним пользователем"""
         items_data = [
             {
@@ -337,30 +473,31 @@ class TestIntegrationScenarios:
                 "statistics": {"likes": 1, "viewCount": 10, "contacts": 1}
             },
             {
-                "sellerID": seller_id, 
+                "sellerID": seller_id,
                 "name": "Multi Item 2",
                 "price": 2000,
                 "statistics": {"likes": 2, "viewCount": 20, "contacts": 2}
             }
         ]
-        
+
         created_ids = []
-        
-        # Создаем несколько объявлений
-        for item_data in items_data:
-            response = api_client.create_item(item_data)
-            assert response.status_code == 200, f"Failed to create item: {item_data['name']}"
-            item_id = api_client.extract_item_id(response)
+
+        # Создаем объявления параллельно — N запросов за один RTT
+        responses = await asyncio.gather(
+            *(async_api_client.create_item(item_data) for item_data in items_data)
+        )
+        for item_data, (status, data) in zip(items_data, responses):
+            assert status == 200, f"Failed to create item: {item_data['name']}"
+            item_id = _extract_item_id_from_payload(data)
             if item_id:
                 created_ids.append(item_id)
-        
+
         # Получаем все объявления пользователя
-        user_items_response = api_client.get_user_items(seller_id)
-        assert user_items_response.status_code == 200, "Failed to get user items"
-        
-        user_items = user_items_response.json()
+        user_items_status, user_items = await async_api_client.get_user_items(seller_id)
+        assert user_items_status == 200, "Failed to get user items"
+
         assert isinstance(user_items, list), "User items should be a list"
-        
+
         print(f"Created {len(created_ids)} items, found {len(user_items)} items for user")
 
 class TestEdgeCases: